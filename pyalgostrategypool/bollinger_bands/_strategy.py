@@ -22,35 +22,58 @@ class BollingerBands(StrategyBase):
 
     def initialize(self):
         self.main_order_map = {}
+        self.decision_cache = {}
+        self.cache_timestamp = None
+        self.completed_instruments = set()
 
     def get_decision(self, instrument):
-        hist_data = self.get_historical_data(instrument)
+        # the bands are computed over a fixed window, so the latest bands only depend on the last TIME_PERIOD candles
+        hist_data = self.get_historical_data(instrument).iloc[-self.time_period:]
+        # read whole columns once; selecting rows of the mixed-type history builds a new object Series per row
+        high_values, low_values, close_values = (hist_data[column].to_numpy() for column in ('high', 'low', 'close'))
 
-        upper_band, _, lower_band = talib.BBANDS(hist_data['close'], timeperiod=self.time_period, nbdevup=self.std_deviations, nbdevdn=self.std_deviations, matype=0)
-        upper_band_value = upper_band.iloc[-1]
-        lower_band_value = lower_band.iloc[-1]
+        upper_band, _, lower_band = talib.BBANDS(close_values, timeperiod=self.time_period, nbdevup=self.std_deviations, nbdevdn=self.std_deviations, matype=0)
+        upper_band_value = upper_band[-1]
+        lower_band_value = lower_band[-1]
 
-        latest_candle = hist_data.iloc[-1]
-        previous_candle = hist_data.iloc[-2]
+        previous_high, previous_low, previous_close = high_values[-2], low_values[-2], close_values[-2]
+        latest_close = close_values[-1]
 
-        if (previous_candle['open'] <= lower_band_value or previous_candle['high'] <= lower_band_value or previous_candle['low'] <= lower_band_value or previous_candle['close'] <= lower_band_value) and \
-                (latest_candle['close'] > previous_candle['close']):
+        # the low (high) is the smallest (largest) price of a candle, so it alone decides whether any of its prices touched the lower (upper) band
+        if previous_low <= lower_band_value and latest_close > previous_close:
             action = 'BUY'
-        elif (previous_candle['open'] >= upper_band_value or previous_candle['high'] >= upper_band_value or previous_candle['low'] >= upper_band_value or previous_candle['close'] >= upper_band_value) and \
-                (latest_candle['close'] < previous_candle['close']):
+        elif previous_high >= upper_band_value and latest_close < previous_close:
             action = 'SELL'
         else:
             action = None
 
         return action
 
+    def get_cached_decision(self, candle, instrument):
+        if candle.start_at != self.cache_timestamp:
+            self.decision_cache = {}
+            self.cache_timestamp = candle.start_at
+
+        if instrument not in self.decision_cache:
+            self.decision_cache[instrument] = self.get_decision(instrument)
+
+        return self.decision_cache[instrument]
+
+    def is_main_order_complete(self, instrument, main_order):
+        if instrument not in self.completed_instruments:
+            if main_order.get_order_status() is not BrokerOrderStatusConstants.COMPLETE:
+                return False
+            self.completed_instruments.add(instrument)
+
+        return True
+
     def strategy_select_instruments_for_entry(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
 
             if self.main_order_map.get(instrument) is None:
-                action = self.get_decision(instrument)
+                action = self.get_cached_decision(candle, instrument)
 
                 if action is not None:
                     selected_instruments.append(instrument)
@@ -59,8 +82,9 @@ class BollingerBands(StrategyBase):
         return selected_instruments, meta
 
     def strategy_enter_position(self, candle, instrument, meta):
-        self.main_order_map[instrument] = _ = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
+        self.main_order_map[instrument] = order
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
@@ -68,10 +92,11 @@ class BollingerBands(StrategyBase):
         for instrument in instruments_bucket:
             main_order = self.main_order_map.get(instrument)
 
-            if main_order is not None and main_order.get_order_status() is BrokerOrderStatusConstants.COMPLETE:
-                action = self.get_decision(instrument)
+            if main_order is not None and self.is_main_order_complete(instrument, main_order):
+                action = self.get_cached_decision(candle, instrument)
+                transaction_type = main_order.order_transaction_type
 
-                if (action == 'SELL' and main_order.order_transaction_type is BrokerOrderTransactionTypeConstants.BUY) or (action == 'BUY' and main_order.order_transaction_type is BrokerOrderTransactionTypeConstants.SELL):
+                if (action == 'SELL' and transaction_type is BrokerOrderTransactionTypeConstants.BUY) or (action == 'BUY' and transaction_type is BrokerOrderTransactionTypeConstants.SELL):
                     selected_instruments.append(instrument)
                     meta.append({'action': 'EXIT'})
 
@@ -81,5 +106,6 @@ class BollingerBands(StrategyBase):
         if meta['action'] == 'EXIT':
             self.main_order_map[instrument].exit_position()
             self.main_order_map[instrument] = None
+            self.completed_instruments.discard(instrument)
             return True
         return False
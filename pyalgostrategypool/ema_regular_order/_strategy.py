@@ -4,9 +4,13 @@
         - generalised docs in detail here : https://algobulls.github.io/pyalgotrading/strategies/strategy_guides/common_strategy_guide/
 """
 
+from collections import namedtuple
+
 import talib
 from pyalgotrading.strategy import StrategyBase
 
+EMAState = namedtuple('EMAState', 'timestamp emas')
+
 
 class EMARegularOrder(StrategyBase):
     name = 'EMA Regular Order'
@@ -16,44 +20,91 @@ class EMARegularOrder(StrategyBase):
 
         self.timeperiod1 = self.strategy_parameters['TIMEPERIOD1']
         self.timeperiod2 = self.strategy_parameters['TIMEPERIOD2']
+        self.ema_time_periods = (self.timeperiod1, self.timeperiod2)
+        self.action_constants = {1: 'BUY', -1: 'SELL'}
 
         self.main_order_map = None
 
     def initialize(self):
         self.main_order_map = {}
+        self.crossover_value_cache = {}
+        self.cache_timestamp = None
+        self.ema_state_map = {}
 
-    def get_crossover_value(self, instrument):
+    @staticmethod
+    def get_next_ema(ema, value, time_period):
+        return (value - ema) * (2.0 / (time_period + 1)) + ema
+
+    def get_seed_ema(self, values, time_period):
+        ema = 0.0
+        for value in values[:time_period]:
+            ema += value
+        ema /= time_period
+
+        for value in values[time_period:]:
+            ema = self.get_next_ema(ema, value, time_period)
+
+        return ema
+
+    def get_ema_values(self, instrument):
         hist_data = self.get_historical_data(instrument)
+        timestamps, closes = hist_data['timestamp'], hist_data['close']
+
+        if len(closes) < max(self.ema_time_periods) + 2:
+            return [talib.EMA(closes, timeperiod=time_period).iloc[-2:] for time_period in self.ema_time_periods]
 
-        ema_x = talib.EMA(hist_data['close'], timeperiod=self.timeperiod1)
-        ema_y = talib.EMA(hist_data['close'], timeperiod=self.timeperiod2)
+        ema_state = self.ema_state_map.get(instrument)
+        if ema_state is None or ema_state.timestamp != timestamps.iloc[-2]:
+            if ema_state is not None and ema_state.timestamp == timestamps.iloc[-3]:
+                emas = [self.get_next_ema(ema, closes.iloc[-2], time_period) for ema, time_period in zip(ema_state.emas, self.ema_time_periods)]
+            else:
+                previous_closes = closes.tolist()[:-1]
+                emas = [self.get_seed_ema(previous_closes, time_period) for time_period in self.ema_time_periods]
+            ema_state = self.ema_state_map[instrument] = EMAState(timestamps.iloc[-2], emas)
+
+        latest_close = closes.iloc[-1]
+        return [[ema, self.get_next_ema(ema, latest_close, time_period)] for ema, time_period in zip(ema_state.emas, self.ema_time_periods)]
+
+    def get_crossover_value(self, instrument):
+        ema_x, ema_y = self.get_ema_values(instrument)
 
         crossover_value = self.utils.crossover(ema_x, ema_y)
         return crossover_value
 
+    def get_cached_crossover_value(self, candle, instrument):
+        if candle.start_at != self.cache_timestamp:
+            self.crossover_value_cache = {}
+            self.cache_timestamp = candle.start_at
+
+        if instrument not in self.crossover_value_cache:
+            self.crossover_value_cache[instrument] = self.get_crossover_value(instrument)
+
+        return self.crossover_value_cache[instrument]
+
     def strategy_select_instruments_for_entry(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
-            crossover = self.get_crossover_value(instrument)
-            action_constants = {1: 'BUY', -1: 'SELL'}
+            if self.main_order_map.get(instrument) is None:
+                crossover = self.get_cached_crossover_value(candle, instrument)
 
-            if crossover in [-1, 1]:
-                selected_instruments.append(instrument)
-                meta.append({'action': action_constants[crossover]})
+                if crossover in self.action_constants:
+                    selected_instruments.append(instrument)
+                    meta.append({'action': self.action_constants[crossover]})
 
         return selected_instruments, meta
 
     def strategy_enter_position(self, candle, instrument, meta):
-        self.main_order_map[instrument] = _ = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
+        self.main_order_map[instrument] = order
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
             if self.main_order_map.get(instrument) is not None:
-                crossover = self.get_crossover_value(instrument)
+                crossover = self.get_cached_crossover_value(candle, instrument)
 
                 if crossover in [1, -1]:
                     selected_instruments.append(instrument)
@@ -4,9 +4,13 @@
         - generalised docs in detail here : https://algobulls.github.io/pyalgotrading/strategies/strategy_guides/common_strategy_guide/
 """
 
+from collections import namedtuple
+
 import talib
 from pyalgotrading.strategy import StrategyBase
 
+MACDState = namedtuple('MACDState', 'timestamp fast_ema slow_ema macd_signal')
+
 
 class MACDCrossover(StrategyBase):
     name = 'MACD Crossover'
@@ -17,41 +21,115 @@ class MACDCrossover(StrategyBase):
         self.timeperiod_fast = self.strategy_parameters['TIMEPERIOD_FAST']
         self.timeperiod_slow = self.strategy_parameters['TIMEPERIOD_SLOW']
         self.timeperiod_signal = self.strategy_parameters['TIMEPERIOD_SIGNAL']
+        # TA-Lib always uses the shorter period for the fast EMA
+        self.ema_fast_period, self.ema_slow_period = sorted((self.timeperiod_fast, self.timeperiod_slow))
+        self.action_constants = {1: 'BUY', -1: 'SELL'}
         self.main_order_map = None
 
     def initialize(self):
         self.main_order_map = {}
+        self.crossover_cache = {}
+        self.cache_timestamp = None
+        self.macd_state_map = {}
+
+    @staticmethod
+    def get_next_ema(ema, value, time_period):
+        return (value - ema) * (2.0 / (time_period + 1)) + ema
+
+    @staticmethod
+    def get_sma(values):
+        total = 0.0
+        for value in values:
+            total += value
+        return total / len(values)
+
+    def get_next_macd_state(self, macd_state, timestamp, close):
+        fast_ema = self.get_next_ema(macd_state.fast_ema, close, self.ema_fast_period)
+        slow_ema = self.get_next_ema(macd_state.slow_ema, close, self.ema_slow_period)
+        macd_signal = self.get_next_ema(macd_state.macd_signal, fast_ema - slow_ema, self.timeperiod_signal)
+
+        return MACDState(timestamp, fast_ema, slow_ema, macd_signal)
+
+    def get_seed_macd_state(self, timestamps, closes):
+        # like TA-Lib, both EMAs are seeded on the candle where the slow EMA starts, and the signal line on the first full window of the MACD line
+        fast_ema = self.get_sma(closes[self.ema_slow_period - self.ema_fast_period:self.ema_slow_period])
+        slow_ema = self.get_sma(closes[:self.ema_slow_period])
+        macd_line = [fast_ema - slow_ema]
+        signal_start = self.ema_slow_period + self.timeperiod_signal - 1
+        for close in closes[self.ema_slow_period:signal_start]:
+            fast_ema = self.get_next_ema(fast_ema, close, self.ema_fast_period)
+            slow_ema = self.get_next_ema(slow_ema, close, self.ema_slow_period)
+            macd_line.append(fast_ema - slow_ema)
+
+        macd_state = MACDState(timestamps[signal_start - 1], fast_ema, slow_ema, self.get_sma(macd_line))
+        for timestamp, close in zip(timestamps[signal_start:], closes[signal_start:]):
+            macd_state = self.get_next_macd_state(macd_state, timestamp, close)
+
+        return macd_state
+
+    def get_macd_values(self, instrument):
+        hist_data = self.get_historical_data(instrument)
+        timestamps, closes = hist_data['timestamp'], hist_data['close']
+
+        if len(closes) < self.ema_slow_period + self.timeperiod_signal + 1:
+            macdline, macdsignal, _ = talib.MACD(closes, fastperiod=self.timeperiod_fast, slowperiod=self.timeperiod_slow, signalperiod=self.timeperiod_signal)
+            return macdline.iloc[-2:], macdsignal.iloc[-2:]
+
+        # the state covers history up to the previous candle; the latest candle is applied on top of it on every call,
+        # so only one step of each EMA is needed per call instead of running talib.MACD over the whole history
+        macd_state = self.macd_state_map.get(instrument)
+        if macd_state is None or macd_state.timestamp != timestamps.iloc[-2]:
+            if macd_state is not None and macd_state.timestamp == timestamps.iloc[-3]:
+                macd_state = self.get_next_macd_state(macd_state, timestamps.iloc[-2], closes.iloc[-2])
+            else:
+                macd_state = self.get_seed_macd_state(timestamps.tolist()[:-1], closes.tolist()[:-1])
+            self.macd_state_map[instrument] = macd_state
+
+        latest_macd_state = self.get_next_macd_state(macd_state, timestamps.iloc[-1], closes.iloc[-1])
+        macdline = [macd_state.fast_ema - macd_state.slow_ema, latest_macd_state.fast_ema - latest_macd_state.slow_ema]
+        macdsignal = [macd_state.macd_signal, latest_macd_state.macd_signal]
+
+        return macdline, macdsignal
 
     def get_crossover(self, instrument):
-        hist_data = self.get_historical_data(instrument)
-        macdline, macdsignal, _ = talib.MACD(hist_data['close'], fastperiod=self.timeperiod_fast, slowperiod=self.timeperiod_slow, signalperiod=self.timeperiod_signal)
+        macdline, macdsignal = self.get_macd_values(instrument)
         crossover_value = self.utils.crossover(macdline, macdsignal)
         return crossover_value
 
+    def get_cached_crossover(self, candle, instrument):
+        if candle.start_at != self.cache_timestamp:
+            self.crossover_cache = {}
+            self.cache_timestamp = candle.start_at
+
+        if instrument not in self.crossover_cache:
+            self.crossover_cache[instrument] = self.get_crossover(instrument)
+
+        return self.crossover_cache[instrument]
+
     def strategy_select_instruments_for_entry(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
             if self.main_order_map.get(instrument) is None:
-                crossover = self.get_crossover(instrument)
-                action_constants = {1: 'BUY', -1: 'SELL'}
+                crossover = self.get_cached_crossover(candle, instrument)
 
-                if crossover in [-1, 1]:
+                if crossover in self.action_constants:
                     selected_instruments.append(instrument)
-                    meta.append({'action': action_constants[crossover]})
+                    meta.append({'action': self.action_constants[crossover]})
 
         return selected_instruments, meta
 
     def strategy_enter_position(self, candle, instrument, sideband_info):
-        self.main_order_map[instrument] = _ = self.broker.OrderRegular(instrument, sideband_info['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, sideband_info['action'], quantity=self.number_of_lots * instrument.lot_size)
+        self.main_order_map[instrument] = order
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
             if self.main_order_map.get(instrument) is not None:
-                crossover = self.get_crossover(instrument)
+                crossover = self.get_cached_crossover(candle, instrument)
                 if crossover in [1, -1]:
                     selected_instruments.append(instrument)
                     meta.append({'action': 'EXIT'})
@@ -20,30 +20,46 @@ class MeanReversionBollingerBands(StrategyBase):
 
     def initialize(self):
         self.main_order_map = {}
+        self.decision_cache = {}
+        self.cache_timestamp = None
 
     def get_decision(self, instrument):
-        hist_data = self.get_historical_data(instrument)
-        upper_band, _, lower_band = talib.BBANDS(hist_data['close'], timeperiod=self.timeperiod, nbdevup=self.std_deviation, nbdevdn=self.std_deviation, matype=0)
-        upper_band_value = upper_band.iloc[-1]
-        lower_band_value = lower_band.iloc[-1]
-        latest_candle = hist_data.iloc[-1]
-        previous_candle = hist_data.iloc[-2]
-
-        if (previous_candle['open'] <= lower_band_value or previous_candle['low'] <= lower_band_value) and (latest_candle['close'] > previous_candle['close']):
+        # the bands are computed over a fixed window, so the latest bands only depend on the last TIMEPERIOD candles
+        hist_data = self.get_historical_data(instrument).iloc[-self.timeperiod:]
+        # read whole columns once; selecting rows of the mixed-type history builds a new object Series per row
+        open_values, low_values, close_values = (hist_data[column].to_numpy() for column in ('open', 'low', 'close'))
+        upper_band, _, lower_band = talib.BBANDS(close_values, timeperiod=self.timeperiod, nbdevup=self.std_deviation, nbdevdn=self.std_deviation, matype=0)
+        upper_band_value = upper_band[-1]
+        lower_band_value = lower_band[-1]
+        previous_open, previous_low, previous_close = open_values[-2], low_values[-2], close_values[-2]
+        latest_close = close_values[-1]
+
+        # the low is the smallest price of a candle, so the open can only be at or below the lower band if the low is too
+        if previous_low <= lower_band_value and latest_close > previous_close:
             action = 'BUY'
-        elif (previous_candle['open'] >= upper_band_value or previous_candle['close'] >= upper_band_value) and (latest_candle['close'] < previous_candle['close']):
+        elif (previous_open >= upper_band_value or previous_close >= upper_band_value) and (latest_close < previous_close):
             action = 'SELL'
         else:
             action = None
 
         return action
 
+    def get_cached_decision(self, candle, instrument):
+        if candle.start_at != self.cache_timestamp:
+            self.decision_cache = {}
+            self.cache_timestamp = candle.start_at
+
+        if instrument not in self.decision_cache:
+            self.decision_cache[instrument] = self.get_decision(instrument)
+
+        return self.decision_cache[instrument]
+
     def strategy_select_instruments_for_entry(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
             if self.main_order_map.get(instrument) is None:
-                action = self.get_decision(instrument)
+                action = self.get_cached_decision(candle, instrument)
                 if action is not None:
                     selected_instruments.append(instrument)
                     meta.append({'action': action})
@@ -51,15 +67,16 @@ class MeanReversionBollingerBands(StrategyBase):
         return selected_instruments, meta
 
     def strategy_enter_position(self, candle, instrument, meta):
-        self.main_order_map[instrument] = _ = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
+        self.main_order_map[instrument] = order
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
             if self.main_order_map.get(instrument) is not None:
-                action = self.get_decision(instrument)
+                action = self.get_cached_decision(candle, instrument)
                 if action is not None:
                     selected_instruments.append(instrument)
                     meta.append({'action': 'EXIT'})
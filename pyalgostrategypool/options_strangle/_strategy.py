@@ -4,8 +4,12 @@
         - generalised docs in detail here : https://algobulls.github.io/pyalgotrading/strategies/strategy_guides/common_strategy_guide/
 """
 
+from collections import namedtuple
+
 from pyalgotrading.strategy import StrategyOptionsBase, OptionsStrikeDirection, OptionsInstrumentDirection
 
+Leg = namedtuple('Leg', 'number tradingsymbol_suffix strike_direction number_of_strikes transaction_type')
+
 
 class OptionsStrangle(StrategyOptionsBase):
     name = 'Options Strangle'
@@ -29,13 +33,17 @@ class OptionsStrangle(StrategyOptionsBase):
         self.tradingsymbol_suffix_map = {1: "CE", 2: "PE"}
         self.strike_direction_map = {0: OptionsStrikeDirection.ITM, 1: OptionsStrikeDirection.ATM, 2: OptionsStrikeDirection.OTM}
 
+        # Legs
+        self._legs = (Leg('LEG_ONE', self.tradingsymbol_suffix_map[self._leg_one_tradingsymbol_suffix], self.strike_direction_map[self._leg_one_strike_direction], self._leg_one_number_of_strikes, self.transaction_type_map[self._leg_one_transaction_type]),
+                      Leg('LEG_TWO', self.tradingsymbol_suffix_map[self._leg_two_tradingsymbol_suffix], self.strike_direction_map[self._leg_two_strike_direction], self._leg_two_number_of_strikes, self.transaction_type_map[self._leg_two_transaction_type]))
+
         # Variables
         self.number_of_allowed_expiry_dates = 1
         self.instruments_done_for_the_day = None
 
     def initialize(self):
         super().initialize()
-        self.instruments_done_for_the_day = []
+        self.instruments_done_for_the_day = set()
 
     def get_child_instrument_details(self, base_instrument, tradingsymbol_suffix, strike_direction, no_of_strikes):
         expiry_date = self.get_allowed_expiry_dates()[0]
@@ -52,7 +60,7 @@ class OptionsStrangle(StrategyOptionsBase):
 
         for instrument in instruments_bucket:
             if instrument not in self.instruments_done_for_the_day:
-                self.instruments_done_for_the_day.append(instrument)
+                self.instruments_done_for_the_day.add(instrument)
 
                 ltp = self.broker.get_ltp(instrument)
 
@@ -60,20 +68,17 @@ class OptionsStrangle(StrategyOptionsBase):
                 self.options_instruments_set_up_local(instrument, "CE", ltp)
                 self.options_instruments_set_up_local(instrument, "PE", ltp)
 
-                leg_wise_list = [('LEG_ONE', self._leg_one_tradingsymbol_suffix, self._leg_one_strike_direction, self._leg_one_number_of_strikes, self._leg_one_transaction_type),
-                                 ('LEG_TWO', self._leg_two_tradingsymbol_suffix, self._leg_two_strike_direction, self._leg_two_number_of_strikes, self._leg_two_transaction_type)]
-
-                for leg_number, tradingingsymbol_suffix, strike_direction, number_of_strikes, transaction_type in leg_wise_list:
-                    self.logger.info(f'Processing {leg_number}...')
-                    child_instrument = self.get_child_instrument_details(instrument, self.tradingsymbol_suffix_map[tradingingsymbol_suffix], self.strike_direction_map[strike_direction], number_of_strikes)
+                for leg in self._legs:
+                    self.logger.info(f'Processing {leg.number}...')
+                    child_instrument = self.get_child_instrument_details(instrument, leg.tradingsymbol_suffix, leg.strike_direction, leg.number_of_strikes)
                     selected_instruments.append(child_instrument)
-                    meta.append({'base_instrument': instrument, 'action': self.transaction_type_map[transaction_type]})
+                    meta.append({'base_instrument': instrument, 'action': leg.transaction_type})
 
         return selected_instruments, meta
 
     def strategy_enter_position(self, candle, instrument, sideband_info):
-        _ = self.broker.OrderRegular(instrument, sideband_info['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, sideband_info['action'], quantity=self.number_of_lots * instrument.lot_size)
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         return [], []
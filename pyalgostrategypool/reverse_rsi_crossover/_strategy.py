@@ -4,9 +4,14 @@
         - generalised docs in detail here : https://algobulls.github.io/pyalgotrading/strategies/strategy_guides/common_strategy_guide/
 """
 
+from collections import namedtuple
+
 import talib
+from pyalgotrading.constants import *
 from pyalgotrading.strategy import StrategyBase
 
+RSIState = namedtuple('RSIState', 'timestamp close average_gain average_loss rsi')
+
 
 class ReverseRSICrossover(StrategyBase):
     name = 'Reverse RSI Crossover'
@@ -17,31 +22,97 @@ class ReverseRSICrossover(StrategyBase):
         self.time_period = self.strategy_parameters['TIME_PERIOD']
         self.overbought_value = self.strategy_parameters['OVERBOUGHT_VALUE']
         self.oversold_value = self.strategy_parameters['OVERSOLD_VALUE']
+        self.overbought_list = [self.overbought_value] * 2
+        self.oversold_list = [self.oversold_value] * 2
 
         self.main_order_map = None
 
     def initialize(self):
         self.main_order_map = {}
-
-    def get_crossover_value(self, instrument):
+        self.crossover_value_cache = {}
+        self.cache_timestamp = None
+        self.rsi_state_map = {}
+
+    def get_next_rsi_state(self, rsi_state, timestamp, close):
+        # Wilder's smoothing, with the same operation order as TA-Lib so the values match talib.RSI
+        change = close - rsi_state.close
+        average_gain = rsi_state.average_gain * (self.time_period - 1)
+        average_loss = rsi_state.average_loss * (self.time_period - 1)
+        if change < 0:
+            average_loss -= change
+        else:
+            average_gain += change
+        average_gain /= self.time_period
+        average_loss /= self.time_period
+
+        return RSIState(timestamp, close, average_gain, average_loss, self.get_rsi(average_gain, average_loss))
+
+    @staticmethod
+    def get_rsi(average_gain, average_loss):
+        total = average_gain + average_loss
+        return 100 * (average_gain / total) if not -1e-8 < total < 1e-8 else 0.0
+
+    def get_seed_rsi_state(self, timestamps, closes):
+        average_gain = average_loss = 0.0
+        for previous_close, close in zip(closes[:self.time_period], closes[1:self.time_period + 1]):
+            change = close - previous_close
+            if change < 0:
+                average_loss -= change
+            else:
+                average_gain += change
+        average_gain /= self.time_period
+        average_loss /= self.time_period
+
+        rsi_state = RSIState(timestamps[self.time_period], closes[self.time_period], average_gain, average_loss, self.get_rsi(average_gain, average_loss))
+        for timestamp, close in zip(timestamps[self.time_period + 1:], closes[self.time_period + 1:]):
+            rsi_state = self.get_next_rsi_state(rsi_state, timestamp, close)
+
+        return rsi_state
+
+    def get_rsi_values(self, instrument):
         hist_data = self.get_historical_data(instrument)
+        timestamps, closes = hist_data['timestamp'], hist_data['close']
+
+        if len(closes) < self.time_period + 2:
+            return talib.RSI(closes, timeperiod=self.time_period).iloc[-2:]
 
-        rsi_value = talib.RSI(hist_data['close'], timeperiod=self.time_period)
+        # the state covers history up to the previous candle; the latest candle is applied on top of it on every call,
+        # so only one smoothing step is needed per call instead of running talib.RSI over the whole history
+        rsi_state = self.rsi_state_map.get(instrument)
+        if rsi_state is None or rsi_state.timestamp != timestamps.iloc[-2]:
+            if rsi_state is not None and rsi_state.timestamp == timestamps.iloc[-3]:
+                rsi_state = self.get_next_rsi_state(rsi_state, timestamps.iloc[-2], closes.iloc[-2])
+            else:
+                rsi_state = self.get_seed_rsi_state(timestamps.tolist()[:-1], closes.tolist()[:-1])
+            self.rsi_state_map[instrument] = rsi_state
 
-        oversold_list = [self.oversold_value] * rsi_value.size
-        overbought_list = [self.overbought_value] * rsi_value.size
+        return [rsi_state.rsi, self.get_next_rsi_state(rsi_state, timestamps.iloc[-1], closes.iloc[-1]).rsi]
 
-        oversold_crossover_value = self.utils.crossover(rsi_value, oversold_list)
-        overbought_crossover_value = self.utils.crossover(rsi_value, overbought_list)
+    def get_crossover_value(self, instrument):
+        # crossover only compares the previous and the latest values
+        rsi_value = self.get_rsi_values(instrument)
+
+        oversold_crossover_value = self.utils.crossover(rsi_value, self.oversold_list)
+        overbought_crossover_value = self.utils.crossover(rsi_value, self.overbought_list)
 
         return oversold_crossover_value, overbought_crossover_value
 
+    def get_cached_crossover_value(self, candle, instrument):
+        if candle.start_at != self.cache_timestamp:
+            self.crossover_value_cache = {}
+            self.cache_timestamp = candle.start_at
+
+        if instrument not in self.crossover_value_cache:
+            self.crossover_value_cache[instrument] = self.get_crossover_value(instrument)
+
+        return self.crossover_value_cache[instrument]
+
     def strategy_select_instruments_for_entry(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
             if self.main_order_map.get(instrument) is None:
-                oversold_crossover_value, overbought_crossover_value = self.get_crossover_value(instrument)
+                oversold_crossover_value, overbought_crossover_value = self.get_cached_crossover_value(candle, instrument)
 
                 if oversold_crossover_value == 1:
                     selected_instruments.append(instrument)
@@ -54,17 +125,21 @@ class ReverseRSICrossover(StrategyBase):
         return selected_instruments, meta
 
     def strategy_enter_position(self, candle, instrument, meta):
-        self.main_order_map[instrument] = _ = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
+        self.main_order_map[instrument] = order
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
-            if self.main_order_map.get(instrument) is not None:
-                oversold_crossover_value, overbought_crossover_value = self.get_crossover_value(instrument)
+            main_order = self.main_order_map.get(instrument)
+
+            if main_order is not None:
+                oversold_crossover_value, overbought_crossover_value = self.get_cached_crossover_value(candle, instrument)
+                transaction_type = main_order.order_transaction_type
 
-                if (oversold_crossover_value == -1 and self.main_order_map[instrument].order_transaction_type.value == 'BUY') or (overbought_crossover_value == 1 and self.main_order_map[instrument].order_transaction_type.value == 'SELL'):
+                if (oversold_crossover_value == -1 and transaction_type is BrokerOrderTransactionTypeConstants.BUY) or (overbought_crossover_value == 1 and transaction_type is BrokerOrderTransactionTypeConstants.SELL):
                     selected_instruments.append(instrument)
                     meta.append({'action': 'EXIT'})
 
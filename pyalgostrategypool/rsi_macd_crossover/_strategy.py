@@ -5,6 +5,7 @@
 """
 
 import talib
+from pyalgotrading.constants import *
 from pyalgotrading.strategy import StrategyBase
 
 
@@ -20,30 +21,44 @@ class RSIMACDCrossover(StrategyBase):
         self.timeperiod_rsi = self.strategy_parameters['TIMEPERIOD_RSI']
         self.oversold_value = self.strategy_parameters['OVERSOLD_VALUE']
         self.overbought_value = self.strategy_parameters['OVERBOUGHT_VALUE']
+        self.oversold_list = [self.oversold_value] * 2
+        self.overbought_list = [self.overbought_value] * 2
         self.main_order_map = None
 
     def initialize(self):
         self.main_order_map = {}
+        self.decision_cache = {}
+        self.cache_timestamp = None
 
     def get_decision(self, instrument):
         hist_data = self.get_historical_data(instrument)
         macdline, macdsignal, _ = talib.MACD(hist_data['close'], fastperiod=self.timeperiod_fast, slowperiod=self.timeperiod_slow, signalperiod=self.timeperiod_signal)
         rsi_value = talib.RSI(macdsignal, timeperiod=self.timeperiod_rsi)
 
-        oversold_list = [self.oversold_value] * rsi_value.size
-        overbought_list = [self.overbought_value] * rsi_value.size
+        # crossover only compares the previous and the latest values
+        rsi_value = rsi_value.iloc[-2:]
 
-        oversold_crossover_value = self.utils.crossover(rsi_value, oversold_list)
-        overbought_crossover_value = self.utils.crossover(rsi_value, overbought_list)
+        oversold_crossover_value = self.utils.crossover(rsi_value, self.oversold_list)
+        overbought_crossover_value = self.utils.crossover(rsi_value, self.overbought_list)
 
         return oversold_crossover_value, overbought_crossover_value
 
+    def get_cached_decision(self, candle, instrument):
+        if candle.start_at != self.cache_timestamp:
+            self.decision_cache = {}
+            self.cache_timestamp = candle.start_at
+
+        if instrument not in self.decision_cache:
+            self.decision_cache[instrument] = self.get_decision(instrument)
+
+        return self.decision_cache[instrument]
+
     def strategy_select_instruments_for_entry(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
             if self.main_order_map.get(instrument) is None:
-                oversold_crossover_value, overbought_crossover_value = self.get_decision(instrument)
+                oversold_crossover_value, overbought_crossover_value = self.get_cached_decision(candle, instrument)
                 if oversold_crossover_value == 1:
                     selected_instruments.append(instrument)
                     meta.append({'action': 'BUY'})
@@ -55,17 +70,20 @@ class RSIMACDCrossover(StrategyBase):
         return selected_instruments, meta
 
     def strategy_enter_position(self, candle, instrument, meta):
-        self.main_order_map[instrument] = _ = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
+        self.main_order_map[instrument] = order
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
-            if self.main_order_map.get(instrument) is not None:
-                oversold_crossover_value, overbought_crossover_value = self.get_decision(instrument)
-                if (oversold_crossover_value == -1) and self.main_order_map[instrument].order_transaction_type.value == 'SELL' or \
-                        ((overbought_crossover_value == 1) and self.main_order_map[instrument].order_transaction_type.value == 'BUY'):
+            main_order = self.main_order_map.get(instrument)
+
+            if main_order is not None:
+                oversold_crossover_value, overbought_crossover_value = self.get_cached_decision(candle, instrument)
+                transaction_type = main_order.order_transaction_type
+                if (oversold_crossover_value == -1 and transaction_type is BrokerOrderTransactionTypeConstants.SELL) or (overbought_crossover_value == 1 and transaction_type is BrokerOrderTransactionTypeConstants.BUY):
                     selected_instruments.append(instrument)
                     meta.append({'action': 'EXIT'})
 
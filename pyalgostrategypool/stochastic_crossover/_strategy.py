@@ -18,36 +18,62 @@ class StochasticCrossover(StrategyBase):
         self.fastk_period = self.strategy_parameters.get('FASTK_PERIOD') or self.strategy_parameters.get('PERIOD')
         self.slowk_period = self.strategy_parameters.get('SLOWK_PERIOD') or self.strategy_parameters.get('SMOOTH_K_PERIOD')
         self.slowd_period = self.strategy_parameters.get('SLOWD_PERIOD') or self.strategy_parameters.get('SMOOTH_D_PERIOD')
+        # %K and %D are simple moving averages over fixed windows, so the last two values only depend on this many candles
+        self.stoch_window = self.fastk_period + self.slowk_period + self.slowd_period - 1
+        self.action_constants = {1: 'BUY', -1: 'SELL'}
 
         self.main_order_map = None
 
     def initialize(self):
         self.main_order_map = {}
+        self.crossover_value_cache = {}
+        self.cache_timestamp = None
+        self.completed_instruments = set()
 
     def get_crossover_value(self, instrument):
-        hist_data = self.get_historical_data(instrument)
+        hist_data = self.get_historical_data(instrument).iloc[-self.stoch_window:]
         slowk, slowd = talib.STOCH(hist_data['high'], hist_data['low'], hist_data['close'], fastk_period=self.fastk_period,
                                    slowk_period=self.slowk_period, slowk_matype=0, slowd_period=self.slowd_period, slowd_matype=0)
-        crossover_value = self.utils.crossover(slowk, slowd)
+
+        # crossover only compares the previous and the latest values
+        crossover_value = self.utils.crossover(slowk.iloc[-2:], slowd.iloc[-2:])
         return crossover_value
 
+    def get_cached_crossover_value(self, candle, instrument):
+        if candle.start_at != self.cache_timestamp:
+            self.crossover_value_cache = {}
+            self.cache_timestamp = candle.start_at
+
+        if instrument not in self.crossover_value_cache:
+            self.crossover_value_cache[instrument] = self.get_crossover_value(instrument)
+
+        return self.crossover_value_cache[instrument]
+
+    def is_main_order_complete(self, instrument, main_order):
+        if instrument not in self.completed_instruments:
+            if main_order.get_order_status() is not BrokerOrderStatusConstants.COMPLETE:
+                return False
+            self.completed_instruments.add(instrument)
+
+        return True
+
     def strategy_select_instruments_for_entry(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
 
         for instrument in instruments_bucket:
             if self.main_order_map.get(instrument) is None:
-                crossover = self.get_crossover_value(instrument)
-                action_constants = {1: 'BUY', -1: 'SELL'}
+                crossover = self.get_cached_crossover_value(candle, instrument)
 
-                if crossover in [-1, 1]:
+                if crossover in self.action_constants:
                     selected_instruments.append(instrument)
-                    meta.append({'action': action_constants[crossover]})
+                    meta.append({'action': self.action_constants[crossover]})
 
         return selected_instruments, meta
 
     def strategy_enter_position(self, candle, instrument, meta):
-        self.main_order_map[instrument] = _ = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
+        self.main_order_map[instrument] = order
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         selected_instruments, meta = [], []
@@ -55,8 +81,8 @@ class StochasticCrossover(StrategyBase):
         for instrument in instruments_bucket:
             main_order = self.main_order_map.get(instrument)
 
-            if main_order is not None and main_order.get_order_status() is BrokerOrderStatusConstants.COMPLETE:
-                crossover = self.get_crossover_value(instrument)
+            if main_order is not None and self.is_main_order_complete(instrument, main_order):
+                crossover = self.get_cached_crossover_value(candle, instrument)
 
                 if crossover in [1, -1]:
                     selected_instruments.append(instrument)
@@ -68,5 +94,6 @@ class StochasticCrossover(StrategyBase):
         if meta['action'] == 'EXIT':
             self.main_order_map[instrument].exit_position()
             self.main_order_map[instrument] = None
+            self.completed_instruments.discard(instrument)
             return True
         return False
@@ -51,8 +51,9 @@ class VolatilityTrendATR(StrategyBase):
         return instruments, meta
 
     def strategy_enter_position(self, candle, instrument, meta):
-        self.main_order_map[instrument] = _ = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
-        return _
+        order = self.broker.OrderRegular(instrument, meta['action'], quantity=self.number_of_lots * instrument.lot_size)
+        self.main_order_map[instrument] = order
+        return order
 
     def strategy_select_instruments_for_exit(self, candle, instruments_bucket):
         instruments, meta = [], []